@@ -1,8 +1,9 @@
 import argparse
+import asyncio
 import csv
 from app.metrics_miner.user_metrics_miner import UserMetricsMiner
 from app.team_builder.team_builder import TeamBuilder
-from app.github_query.github_graphql.client import Client
+from app.github_query.github_graphql.client import AsyncClient
 from app.github_query.github_graphql.authentication import (
     PersonalAccessTokenAuthenticator,
 )
@@ -45,22 +46,42 @@ def parse_arguments():
     return parser.parse_args()
 
 
-def read_usernames_from_csv(csv_file):
+def iter_usernames_from_csv(csv_file):
     """
-    Read usernames from a CSV file.
+    Iterate over usernames in a CSV file.
 
     Args:
         csv_file (str): Path to the CSV file.
 
-    Returns:
-        list: List of usernames.
+    Yields:
+        str: The usernames, one at a time, without materializing the whole file.
     """
-    usernames = []
     with open(csv_file, newline="", encoding="utf-8") as csvfile:
         reader = csv.reader(csvfile)
         for row in reader:
-            usernames.extend(row)
-    return usernames
+            yield from row
+
+
+async def mine_users(client, usernames, languages):
+    """
+    Mine metrics for all usernames concurrently.
+
+    Args:
+        client (AsyncClient): The GitHub client to use for execution.
+        usernames (list): List of GitHub usernames.
+        languages (list): List of programming languages of interest.
+
+    Returns:
+        list: One list of user metrics per username, in input order.
+    """
+    async with client:
+        miners = [UserMetricsMiner(client) for _ in usernames]
+        return await asyncio.gather(
+            *(
+                miner.mine(username, languages)
+                for miner, username in zip(miners, usernames)
+            )
+        )
 
 
 def main():
@@ -69,9 +90,10 @@ def main():
     """
     args = parse_arguments()
 
-    # Read usernames from CSV if provided
+    # Read usernames from CSV if provided; asyncio.gather needs the full set of tasks up
+    # front, so the streamed usernames are materialized only here
     if args.csv_file:
-        usernames = read_usernames_from_csv(args.csv_file)
+        usernames = list(iter_usernames_from_csv(args.csv_file))
     else:
         usernames = args.usernames
 
@@ -82,16 +104,13 @@ def main():
         return
 
     # Initialize GitHub client
-    clt = Client(
+    clt = AsyncClient(
         host="api.github.com",
         is_enterprise=False,
         authenticator=PersonalAccessTokenAuthenticator(token=args.auth_token),
     )
 
-    miner = UserMetricsMiner(clt)
-    data = []
-    for username in usernames:
-        data.append(miner.mine(username, args.languages))
+    data = asyncio.run(mine_users(clt, usernames, args.languages))
 
     teams = TeamBuilder(data).form_teams(
         n_teams=args.n_teams, size_min=args.size_min, size_max=args.size_max
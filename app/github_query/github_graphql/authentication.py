@@ -1,6 +1,11 @@
 """The module defines base Authenticator class that returns an authorization header."""
 
-from typing import Dict
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# GitHub grants each token 5000 rate-limit points per hour.
+TOKEN_HOURLY_BUDGET = 5000
 
 
 class Authenticator:
@@ -46,3 +51,91 @@ class PersonalAccessTokenAuthenticator(Authenticator):
             using a personal access token.
         """
         return {"Authorization": f"token {self._token}"}
+
+
+class TokenPoolAuthenticator(Authenticator):
+    """
+    TokenPoolAuthenticator is a concrete implementation of the Authenticator class that rotates
+    across multiple personal access tokens, always serving the token with the most remaining
+    rate-limit budget. The clients report the rateLimit block of each response back through
+    update_rate_limit, so N tokens multiply the hourly budget by N with no extra requests.
+    """
+
+    def __init__(self, tokens: List[str]) -> None:
+        """
+        Initializes the authenticator with a pool of personal access tokens.
+
+        Args:
+            tokens (List[str]): The personal access tokens used for authentication.
+        """
+        if not tokens:
+            raise ValueError("Token pool must not be empty")
+        self._entries = [
+            {"token": token, "remaining": TOKEN_HOURLY_BUDGET, "reset_at": 0.0}
+            for token in tokens
+        ]
+        # maps the Authorization header value back to its pool entry, so budget reports
+        # can be attributed to the token that actually served the request
+        self._by_header = {
+            f"token {entry['token']}": entry for entry in self._entries
+        }
+        self._current = self._entries[0]
+
+    @staticmethod
+    def _effective_remaining(entry: Dict) -> int:
+        """
+        Returns the usable budget of a token, treating a token whose reset time has passed as
+        fully replenished.
+
+        Args:
+            entry (Dict): The pool entry of the token.
+
+        Returns:
+            int: The number of rate-limit points the token can currently spend.
+        """
+        if time.time() >= entry["reset_at"]:
+            return TOKEN_HOURLY_BUDGET
+        return entry["remaining"]
+
+    def max_remaining(self) -> int:
+        """
+        Returns the largest usable budget across the pool, letting callers decide whether any
+        token can still serve requests before waiting for a reset.
+
+        Returns:
+            int: The best remaining rate-limit budget in the pool.
+        """
+        return max(self._effective_remaining(entry) for entry in self._entries)
+
+    def get_authorization_header(self) -> Dict[str, str]:
+        """
+        Constructs and returns the authorization header using the pooled token with the most
+        remaining rate-limit budget.
+
+        Returns:
+            dict: A dictionary representing the authorization header required for authentication
+            with the GitHub API.
+        """
+        self._current = max(self._entries, key=self._effective_remaining)
+        return {"Authorization": f"token {self._current['token']}"}
+
+    def update_rate_limit(
+        self, remaining: int, reset_at: str, auth_header: Optional[str] = None
+    ) -> None:
+        """
+        Records the rate-limit budget reported for a served token. With many requests in
+        flight at once, responses can arrive out of order relative to token selection, so
+        the Authorization header the request was sent with identifies which entry the
+        budget belongs to; without it, the most recently selected token is assumed.
+
+        Args:
+            remaining (int): The remaining rate-limit points reported by the API.
+            reset_at (str): The ISO timestamp at which the token's budget resets.
+            auth_header (Optional[str]): The Authorization header value of the request the
+            budget was reported for.
+        """
+        entry = self._by_header.get(auth_header, self._current)
+        entry["remaining"] = remaining
+        entry["reset_at"] = datetime.fromisoformat(
+            reset_at.replace("Z", "+00:00")
+        ).timestamp()
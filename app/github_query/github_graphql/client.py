@@ -1,15 +1,22 @@
-"""The module defines a client class that executes the given GraphQL query string."""
+"""The module defines client classes that execute the given GraphQL query string."""
 
-import re
+import asyncio
+import hashlib
+import random
 import time
-from datetime import datetime, timezone
-from typing import Union, Optional, Dict, Any, Generator, Tuple
+from collections import OrderedDict
+from datetime import datetime
+from typing import Union, Optional, Dict, Any, AsyncGenerator, Callable, Generator, Tuple
+import aiohttp
+import diskcache
+import orjson
 import requests
-from requests.exceptions import Timeout, RequestException
+from requests.adapters import HTTPAdapter
+from aiolimiter import AsyncLimiter
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
 from requests import Response
 from app.github_query.github_graphql.authentication import Authenticator
 from app.github_query.github_graphql.query import Query, PaginatedQuery
-from app.github_query.queries.costs.query_cost import QueryCost
 
 
 class InvalidAuthenticationError(Exception):
@@ -40,6 +47,175 @@ class QueryFailedException(Exception):
         super().__init__(message)
 
 
+class _LocalResponse:
+    """
+    Minimal stand-in for requests.Response carrying a status code and body. It is used for
+    aiohttp responses and cached responses, so that QueryFailedException can be raised and
+    bodies parsed uniformly across the clients. from_cache marks bodies served from the
+    response cache, whose rate-limit snapshots are stale and must not be replayed.
+    """
+
+    def __init__(self, status_code: int, text: str, from_cache: bool = False) -> None:
+        self.status_code = status_code
+        self.text = text
+        self.from_cache = from_cache
+
+    def json(self) -> Dict[str, Any]:
+        """
+        Parses and returns the response body as JSON.
+
+        Returns:
+            Dict[str, Any]: The parsed JSON body.
+        """
+        return orjson.loads(self.text)
+
+
+class _ResponseCache:
+    """
+    Content-addressed cache of successful GraphQL response bodies, keyed by the SHA-256 of the
+    query string. Entries live in two tiers: a small in-process LRU dictionary answering
+    repeated queries within a session without touching disk, backed by an on-disk store that
+    survives process restarts. Entries are served directly while fresh (within the TTL) and
+    revalidated with If-None-Match once stale, so repeated runs cost a 304 instead of a full,
+    rate-limited response.
+    """
+
+    def __init__(
+        self, directory: str, ttl_seconds: int, memory_entries: int = 1024
+    ) -> None:
+        self._cache = diskcache.Cache(directory)
+        self._ttl_seconds = ttl_seconds
+        self._memory_entries = memory_entries
+        # LRU order is maintained with move_to_end on hit and popitem(last=False) on overflow
+        self._memory: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def key(query: str) -> str:
+        """
+        Computes the cache key for a rendered query string.
+
+        Args:
+            query (str): The rendered GraphQL query string.
+
+        Returns:
+            str: A hex digest identifying the query.
+        """
+        return hashlib.sha256(query.encode()).hexdigest()
+
+    def _remember(self, key: str, entry: Tuple[str, Optional[str], float]) -> None:
+        """
+        Places an entry into the in-process LRU tier, evicting the least recently used entry
+        once the tier is full.
+
+        Args:
+            key (str): The cache key of the query.
+            entry (Tuple): The (body, etag, stored_at) entry.
+        """
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        if len(self._memory) > self._memory_entries:
+            self._memory.popitem(last=False)
+
+    def lookup(self, key: str) -> Tuple[Optional[str], Optional[str], bool]:
+        """
+        Looks up a cached response body, trying the in-process tier before the on-disk store.
+
+        Args:
+            key (str): The cache key of the query.
+
+        Returns:
+            A tuple of the cached body (or None on a miss), its ETag (or None), and whether the
+            entry is still within its TTL.
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+        else:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None, None, False
+            self._remember(key, entry)
+        text, etag, stored_at = entry
+        return text, etag, time.time() - stored_at < self._ttl_seconds
+
+    def store(self, key: str, text: str, etag: Optional[str]) -> None:
+        """
+        Stores a successful response body together with its ETag and storage time in both tiers.
+
+        Args:
+            key (str): The cache key of the query.
+            text (str): The response body.
+            etag (Optional[str]): The ETag header of the response, if any.
+        """
+        entry = (text, etag, time.time())
+        self._remember(key, entry)
+        self._cache.set(key, entry)
+
+    def refresh(self, key: str) -> Optional[str]:
+        """
+        Resets the TTL of an entry that the server revalidated with a 304 response.
+
+        Args:
+            key (str): The cache key of the query.
+
+        Returns:
+            Optional[str]: The revalidated body, or None if the entry disappeared.
+        """
+        entry = self._memory.get(key) or self._cache.get(key)
+        if entry is None:
+            return None
+        text, etag, _ = entry
+        self.store(key, text, etag)
+        return text
+
+    def clear(self) -> None:
+        """
+        Drops every entry from both tiers, forcing subsequent queries back to the network.
+        """
+        self._memory.clear()
+        self._cache.clear()
+
+
+# The spliced selection is aliased so it never collides with, and can be popped without
+# disturbing, a rateLimit selection the caller asked for themselves.
+RATE_LIMIT_ALIAS = "_rl"
+RATE_LIMIT_SELECTION = f"{RATE_LIMIT_ALIAS}: rateLimit {{ cost remaining resetAt }}"
+
+# HTTP statuses worth retrying after a backoff rather than failing outright.
+RETRYABLE_STATUS_CODES = (429, 502, 503, 504)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """
+    Computes an exponential backoff delay with jitter for the given retry attempt, capped at
+    8 seconds so exhausted retries still fail promptly.
+
+    Args:
+        attempt (int): The zero-based retry attempt number.
+
+    Returns:
+        float: The number of seconds to sleep before the next attempt.
+    """
+    return min(0.25 * 2**attempt + random.random() * 0.25, 8.0)
+
+
+def _attach_rate_limit(query: str) -> str:
+    """
+    Appends an aliased rateLimit selection to the outermost query block so that every response
+    reports the cost and remaining budget of the query it answers, with no extra round-trip.
+
+    Args:
+        query (str): The rendered GraphQL query string.
+
+    Returns:
+        str: The query string with the rateLimit selection spliced in.
+    """
+    if f"{RATE_LIMIT_ALIAS}:" in query:
+        return query
+    closing = query.rindex("}")
+    return f"{query[:closing]} {RATE_LIMIT_SELECTION} {query[closing:]}"
+
+
 class Client:
     """
     Client is a class that sends the given GraphQL queries to the GitHub GraphQL API and returns the query results.
@@ -55,6 +231,8 @@ class Client:
         authenticator: Optional[Authenticator] = None,
         retry_attempts: int = 3,
         timeout_seconds: int = 10,
+        cache_directory: str = ".gh_cache",
+        cache_ttl_seconds: int = 3600,
     ) -> None:
         """
         Initializes the client with the necessary configuration and authentication.
@@ -66,6 +244,8 @@ class Client:
             authenticator (Optional[Authenticator]): The authenticator instance for handling authentication.
             retry_attempts (int): The number of times to retry the request before giving up.
             timeout_seconds (int): The number of seconds to wait for a response before timing out.
+            cache_directory (str): The directory holding the on-disk response cache.
+            cache_ttl_seconds (int): How long cached responses are served without revalidation.
 
         Raises:
             InvalidAuthenticationError: If no authenticator is provided or if the provided authenticator is invalid.
@@ -73,8 +253,22 @@ class Client:
         self._protocol = protocol
         self._host = host
         self._is_enterprise = is_enterprise
+        # enterprise instances serve GraphQL under /api/graphql rather than /graphql
+        self._base_url = (
+            f"{protocol}://{host}/{'api/graphql' if is_enterprise else 'graphql'}"
+        )
         self._retry_attempts = retry_attempts
         self._timeout_seconds = timeout_seconds
+        self._rate_limit_resume_at = 0.0
+        # worst query cost seen so far, used to estimate the cost of the next request
+        self._max_observed_cost = 1
+        self._response_cache = _ResponseCache(cache_directory, cache_ttl_seconds)
+        # one keep-alive session so paginated queries reuse the TCP+TLS connection
+        self._session = requests.Session()
+        self._session.mount(
+            f"{protocol}://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=64, max_retries=0),
+        )
 
         if authenticator is None:
             raise InvalidAuthenticationError("Authentication needs to be specified")
@@ -82,16 +276,12 @@ class Client:
 
     def _base_path(self) -> str:
         """
-        Constructs the base URL path for the GitHub GraphQL API.
+        Returns the base URL path for the GitHub GraphQL API, precomputed in __init__.
 
         Returns:
             str: The base URL path for the GitHub GraphQL API.
         """
-        return (
-            f"{self._protocol}://{self._host}/graphql"
-            if self._is_enterprise
-            else f"{self._protocol}://{self._host}/graphql"
-        )
+        return self._base_url
 
     def _generate_headers(self, **kwargs) -> Dict[str, str]:
         """
@@ -121,40 +311,86 @@ class Client:
         """
         if isinstance(query, Query):
             query = query.get_query()
+        key = _ResponseCache.key(query)
+        cached_text, etag, fresh = self._response_cache.lookup(key)
+        if fresh:
+            return _LocalResponse(200, cached_text, from_cache=True)
+        headers = self._generate_headers(**{"Content-Type": "application/json"})
+        if etag is not None:
+            headers["If-None-Match"] = etag
         last_exception = None
         response = None
-        for _ in range(self._retry_attempts):
+        for attempt in range(self._retry_attempts):
             try:
-                response = requests.post(
+                response = self._session.post(
                     self._base_path(),
-                    json={"query": query},
-                    headers=self._generate_headers(),
+                    data=orjson.dumps({"query": query}),
+                    headers=headers,
                     timeout=self._timeout_seconds,
                 )
+                if response.status_code == 304:
+                    refreshed = self._response_cache.refresh(key)
+                    if refreshed is not None:
+                        return _LocalResponse(200, refreshed, from_cache=True)
+                    # the entry was culled between lookup and revalidation; drop the
+                    # validator so the next attempt fetches a full response
+                    headers.pop("If-None-Match", None)
+                    continue
                 if response.status_code == 200:
+                    self._response_cache.store(
+                        key, response.text, response.headers.get("ETag")
+                    )
+                    # record which token served the request so the budget report can be
+                    # attributed to the right pool entry
+                    response.auth_header = headers["Authorization"]
                     return response
-            except Timeout as e:
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    retry_after = response.headers.get("Retry-After")
+                    time.sleep(
+                        float(retry_after)
+                        if retry_after is not None
+                        else _backoff_delay(attempt)
+                    )
+            except (Timeout, RequestsConnectionError) as e:
                 last_exception = e
-                print("Request timed out. Retrying...")
+                print("Request failed. Retrying...")
+                time.sleep(_backoff_delay(attempt))
         # If this point is reached, all retries have been exhausted
         if not last_exception:
             raise QueryFailedException(query=query, response=response)
         raise Timeout("All retry attempts exhausted.")
 
-    def _have_limit(self, query: Union[str, Query]) -> Tuple[bool, str]:
-        if isinstance(query, Query):
-            query = query.get_query()
-        match = re.search(r"query\s*{(?P<content>.+)}", query)
-        # pre-calculate the cost of the upcoming graphql query
-        rate_query = QueryCost(match.group("content"), dryrun=True).get_query()
-        rate_limit = self._retry_request(rate_query)
-        rate_limit = rate_limit.json()["data"]["rateLimit"]
-        cost, remaining, reset_at = (
-            rate_limit["cost"],
-            rate_limit["remaining"],
-            rate_limit["resetAt"],
-        )
-        return (self._retry_attempts * cost > remaining, reset_at)
+    def _update_rate_limit(
+        self, data: Dict[str, Any], auth_header: Optional[str] = None
+    ) -> None:
+        """
+        Records the rate-limit budget reported alongside a query's own data. If the remaining
+        budget cannot cover another full round of retries, the next request is deferred until
+        the reported reset time.
+
+        Args:
+            data (Dict[str, Any]): The response data, from which the client's aliased
+            rateLimit entry is removed.
+            auth_header (Optional[str]): The Authorization header of the request that
+            produced the data, identifying the token the budget belongs to.
+        """
+        rate_limit = data.pop(RATE_LIMIT_ALIAS, None)
+        if rate_limit is None:
+            return
+        self._max_observed_cost = max(self._max_observed_cost, rate_limit["cost"])
+        estimated_cost = self._retry_attempts * self._max_observed_cost
+        update = getattr(self._authenticator, "update_rate_limit", None)
+        if update is not None:
+            update(rate_limit["remaining"], rate_limit["resetAt"], auth_header)
+            # another pooled token may still have budget, so only wait when the pool is dry
+            if self._authenticator.max_remaining() >= estimated_cost:
+                return
+        if estimated_cost > rate_limit["remaining"]:
+            # fromisoformat is a C fast-path; the trailing Z needs rewriting before 3.11
+            reset_at = datetime.fromisoformat(
+                rate_limit["resetAt"].replace("Z", "+00:00")
+            )
+            self._rate_limit_resume_at = reset_at.timestamp() + 5
 
     def _execute(self, query: Union[str, Query]) -> Dict[str, Any]:
         """
@@ -169,41 +405,53 @@ class Client:
         Raises:
             QueryFailedException: If the query execution fails or returns errors.
         """
-        no_limit, reset_at = self._have_limit(query)
-        # if the cost of the upcoming graphql query larger than avaliable ratelimit,
-        # wait till ratelimit reset
-        if no_limit:
-            current_time = datetime.now(timezone.utc)
-            reset_at = datetime.strptime(reset_at, "%Y-%m-%dT%H:%M:%SZ").replace(
-                tzinfo=timezone.utc
-            )
-            time_diff = reset_at - current_time
-            seconds = time_diff.total_seconds()
+        if isinstance(query, Query):
+            query = query.get_query()
+        query = _attach_rate_limit(query)
+        # if the previous response reported an exhausted rate limit, wait till ratelimit reset
+        seconds = self._rate_limit_resume_at - time.time()
+        if seconds > 0:
+            # a cached body, even a stale one, beats stalling on an exhausted budget
+            cached_text, _, _ = self._response_cache.lookup(_ResponseCache.key(query))
+            if cached_text is not None:
+                data = orjson.loads(cached_text)["data"]
+                data.pop(RATE_LIMIT_ALIAS, None)
+                return data
             print("GitHub GraphQL API Rate Limit Exceeded.")
-            print(f"Stop at {current_time}s.")
             print(f"Waiting for {seconds}s.")
-            print(f"Reset at {reset_at}s.")
-            time.sleep(seconds + 5)
+            time.sleep(seconds)
             # TBD: display the reset time in the frontend
 
         response = self._retry_request(query)
         try:
-            json_response = response.json()
-        except RequestException as e:
+            json_response = orjson.loads(response.text)
+        except ValueError as e:
             raise QueryFailedException(query=query, response=response) from e
 
         if response.status_code == 200 and "errors" not in json_response:
-            return json_response["data"]
+            data = json_response["data"]
+            if getattr(response, "from_cache", False):
+                # the cached body carries the budget snapshot from when it was stored;
+                # replaying it would clobber the live rate-limit accounting
+                data.pop(RATE_LIMIT_ALIAS, None)
+            else:
+                self._update_rate_limit(data, getattr(response, "auth_header", None))
+            return data
         raise QueryFailedException(query=query, response=response)
 
     def _execution_generator(
-        self, query: PaginatedQuery
+        self,
+        query: PaginatedQuery,
+        stop_predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
     ) -> Generator[Dict[str, Any], None, None]:
         """
         Handles the iteration over paginated query results, yielding each page's data as it's fetched.
 
         Args:
             query (Union[Query, PaginatedQuery]): The paginated GraphQL query to execute.
+            stop_predicate (Optional[Callable]): An optional callable invoked with each page's
+            data after it is yielded; returning True stops pagination early, saving the
+            round-trips for pages the caller no longer needs.
 
         Returns:
             Generator[Dict[str, Any], None, None]: A generator yielding each page's data as a dictionary.
@@ -219,16 +467,374 @@ class Client:
             has_next_page = curr_node["pageInfo"]["hasNextPage"]
             query.paginator.update_paginator(has_next_page, end_cursor)
             yield response
+            if stop_predicate is not None and stop_predicate(response):
+                break
 
-    def execute(self, query: Union[str, Query, PaginatedQuery]) -> Dict[str, Any]:
+    def execute(
+        self,
+        query: Union[str, Query, PaginatedQuery],
+        stop_predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Dict[str, Any]:
         """
         Public method to execute a non-paginated or paginated query.
 
         Args:
             query (Union[str, Query, PaginatedQuery]): The GraphQL query to execute.
+            stop_predicate (Optional[Callable]): For paginated queries, an optional callable
+            that stops pagination early once a yielded page satisfies it.
         Returns:
             Dict[str, Any]: The parsed JSON response from the server.
         """
         if isinstance(query, PaginatedQuery):
-            return self._execution_generator(query)
+            return self._execution_generator(query, stop_predicate)
         return self._execute(query)
+
+    def clear_cache(self) -> None:
+        """
+        Drops every cached response, forcing subsequent queries back to the network.
+        """
+        self._response_cache.clear()
+
+
+class AsyncClient:
+    """
+    AsyncClient is the asyncio counterpart of Client. It sends the given GraphQL queries to the
+    GitHub GraphQL API over a shared aiohttp session, which allows many queries (e.g. one per
+    mined user) to be in flight concurrently instead of being serialized behind blocking POSTs.
+    It supports both public GitHub and GitHub Enterprise.
+    """
+
+    def __init__(
+        self,
+        protocol: str = "https",
+        host: str = "api.github.com",
+        is_enterprise: bool = False,
+        authenticator: Optional[Authenticator] = None,
+        retry_attempts: int = 3,
+        timeout_seconds: int = 10,
+        max_connections: int = 64,
+        max_concurrency: int = 32,
+        requests_per_second: float = 5000 / 3600,
+        cache_directory: str = ".gh_cache",
+        cache_ttl_seconds: int = 3600,
+    ) -> None:
+        """
+        Initializes the async client with the necessary configuration and authentication.
+
+        Args:
+            protocol (str): The protocol to use for connecting to the GitHub server.
+            host (str): The host address of the GitHub server.
+            is_enterprise (bool): Indicates whether the client is connecting to a GitHub Enterprise instance.
+            authenticator (Optional[Authenticator]): The authenticator instance for handling authentication.
+            retry_attempts (int): The number of times to retry the request before giving up.
+            timeout_seconds (int): The number of seconds to wait for a response before timing out.
+            max_connections (int): The maximum number of simultaneous connections kept by the session.
+            max_concurrency (int): The maximum number of requests allowed to be in flight at once.
+            requests_per_second (float): The sustained request rate allowed by the token-bucket
+            limiter. Defaults to GitHub's 5000 points/hour budget.
+            cache_directory (str): The directory holding the on-disk response cache.
+            cache_ttl_seconds (int): How long cached responses are served without revalidation.
+
+        Raises:
+            InvalidAuthenticationError: If no authenticator is provided or if the provided authenticator is invalid.
+        """
+        self._protocol = protocol
+        self._host = host
+        self._is_enterprise = is_enterprise
+        # enterprise instances serve GraphQL under /api/graphql rather than /graphql
+        self._base_url = (
+            f"{protocol}://{host}/{'api/graphql' if is_enterprise else 'graphql'}"
+        )
+        self._retry_attempts = retry_attempts
+        self._timeout_seconds = timeout_seconds
+        self._max_connections = max_connections
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._rate_limit_resume_at = 0.0
+        # worst query cost seen so far, used to estimate the cost of the next request
+        self._max_observed_cost = 1
+        self._response_cache = _ResponseCache(cache_directory, cache_ttl_seconds)
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._limiter = AsyncLimiter(max_rate=requests_per_second, time_period=1)
+
+        if authenticator is None:
+            raise InvalidAuthenticationError("Authentication needs to be specified")
+        self._authenticator = authenticator
+
+    def _base_path(self) -> str:
+        """
+        Returns the base URL path for the GitHub GraphQL API, precomputed in __init__.
+
+        Returns:
+            str: The base URL path for the GitHub GraphQL API.
+        """
+        return self._base_url
+
+    def _generate_headers(self, **kwargs) -> Dict[str, str]:
+        """
+        Generates the necessary headers for making a GraphQL request, including authentication headers.
+
+        Args:
+            **kwargs: Additional headers to include in the request.
+
+        Returns:
+            Dict[str, str]: A dictionary of headers for the request.
+        """
+        headers = self._authenticator.get_authorization_header()
+        headers.update(kwargs)
+        return headers
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the shared aiohttp session, creating it on first use so that it is bound to the
+        running event loop. The session pools connections across all concurrent queries.
+
+        Returns:
+            aiohttp.ClientSession: The shared session used for all requests.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._max_connections),
+                timeout=aiohttp.ClientTimeout(total=self._timeout_seconds),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Closes the shared aiohttp session and releases its pooled connections.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    @staticmethod
+    def _secondary_limit_delay(raw_response: aiohttp.ClientResponse) -> Optional[float]:
+        """
+        Determines how long to wait before retrying a request rejected by GitHub's secondary
+        rate limits, based on the Retry-After or X-RateLimit-Reset response headers.
+
+        Args:
+            raw_response (aiohttp.ClientResponse): The non-200 response to inspect.
+
+        Returns:
+            Optional[float]: The number of seconds to wait, or None if the response was not
+            rate limited.
+        """
+        if raw_response.status not in (403, 429):
+            return None
+        retry_after = raw_response.headers.get("Retry-After")
+        if retry_after is not None:
+            return float(retry_after)
+        reset_at = raw_response.headers.get("X-RateLimit-Reset")
+        if reset_at is not None:
+            return max(float(reset_at) - time.time(), 0) + 5
+        return None
+
+    async def _retry_request(self, query: Union[str, Query]) -> _LocalResponse:
+        """
+        Tries to send a request multiple times until it succeeds or the retry limit is reached.
+
+        Args:
+            query (Union[str, Query]): The GraphQL query to execute.
+
+        Returns:
+            _LocalResponse: The status code and body of the server's response.
+
+        Raises:
+            Timeout: If all retry attempts are exhausted and the request keeps timing out.
+        """
+        if isinstance(query, Query):
+            query = query.get_query()
+        key = _ResponseCache.key(query)
+        cached_text, etag, fresh = self._response_cache.lookup(key)
+        if fresh:
+            return _LocalResponse(200, cached_text, from_cache=True)
+        headers = self._generate_headers(**{"Content-Type": "application/json"})
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        session = self._get_session()
+        last_exception = None
+        response = None
+        for attempt in range(self._retry_attempts):
+            try:
+                async with self._sem, self._limiter:
+                    async with session.post(
+                        self._base_path(),
+                        data=orjson.dumps({"query": query}),
+                        headers=headers,
+                    ) as raw_response:
+                        if raw_response.status == 304:
+                            refreshed = self._response_cache.refresh(key)
+                            if refreshed is not None:
+                                return _LocalResponse(200, refreshed, from_cache=True)
+                            # the entry was culled between lookup and revalidation; drop
+                            # the validator so the next attempt fetches a full response
+                            headers.pop("If-None-Match", None)
+                            continue
+                        response = _LocalResponse(
+                            raw_response.status, await raw_response.text()
+                        )
+                        if response.status_code == 200:
+                            self._response_cache.store(
+                                key, response.text, raw_response.headers.get("ETag")
+                            )
+                            # record which token served the request so the budget report
+                            # can be attributed to the right pool entry
+                            response.auth_header = headers["Authorization"]
+                            return response
+                        retry_delay = self._secondary_limit_delay(raw_response)
+                        if (
+                            retry_delay is None
+                            and raw_response.status in RETRYABLE_STATUS_CODES
+                        ):
+                            retry_delay = _backoff_delay(attempt)
+                # sleep outside the semaphore so other requests are not blocked
+                if retry_delay is not None:
+                    await asyncio.sleep(retry_delay)
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+                last_exception = e
+                print("Request failed. Retrying...")
+                await asyncio.sleep(_backoff_delay(attempt))
+        # If this point is reached, all retries have been exhausted
+        if not last_exception:
+            raise QueryFailedException(query=query, response=response)
+        raise Timeout("All retry attempts exhausted.")
+
+    def _update_rate_limit(
+        self, data: Dict[str, Any], auth_header: Optional[str] = None
+    ) -> None:
+        """
+        Records the rate-limit budget reported alongside a query's own data. If the remaining
+        budget cannot cover another full round of retries, the next request is deferred until
+        the reported reset time.
+
+        Args:
+            data (Dict[str, Any]): The response data, from which the client's aliased
+            rateLimit entry is removed.
+            auth_header (Optional[str]): The Authorization header of the request that
+            produced the data, identifying the token the budget belongs to.
+        """
+        rate_limit = data.pop(RATE_LIMIT_ALIAS, None)
+        if rate_limit is None:
+            return
+        self._max_observed_cost = max(self._max_observed_cost, rate_limit["cost"])
+        estimated_cost = self._retry_attempts * self._max_observed_cost
+        update = getattr(self._authenticator, "update_rate_limit", None)
+        if update is not None:
+            update(rate_limit["remaining"], rate_limit["resetAt"], auth_header)
+            # another pooled token may still have budget, so only wait when the pool is dry
+            if self._authenticator.max_remaining() >= estimated_cost:
+                return
+        if estimated_cost > rate_limit["remaining"]:
+            # fromisoformat is a C fast-path; the trailing Z needs rewriting before 3.11
+            reset_at = datetime.fromisoformat(
+                rate_limit["resetAt"].replace("Z", "+00:00")
+            )
+            self._rate_limit_resume_at = reset_at.timestamp() + 5
+
+    async def _execute(self, query: Union[str, Query]) -> Dict[str, Any]:
+        """
+        Executes a query and handles response processing and error checking.
+
+        Args:
+            query (Union[str, Query]): The GraphQL query to execute.
+
+        Returns:
+            Dict[str, Any]: The parsed JSON response from the server.
+
+        Raises:
+            QueryFailedException: If the query execution fails or returns errors.
+        """
+        if isinstance(query, Query):
+            query = query.get_query()
+        query = _attach_rate_limit(query)
+        # if the previous response reported an exhausted rate limit, wait till ratelimit reset
+        seconds = self._rate_limit_resume_at - time.time()
+        if seconds > 0:
+            # a cached body, even a stale one, beats stalling on an exhausted budget
+            cached_text, _, _ = self._response_cache.lookup(_ResponseCache.key(query))
+            if cached_text is not None:
+                data = orjson.loads(cached_text)["data"]
+                data.pop(RATE_LIMIT_ALIAS, None)
+                return data
+            print("GitHub GraphQL API Rate Limit Exceeded.")
+            print(f"Waiting for {seconds}s.")
+            await asyncio.sleep(seconds)
+
+        response = await self._retry_request(query)
+        try:
+            json_response = orjson.loads(response.text)
+        except ValueError as e:
+            raise QueryFailedException(query=query, response=response) from e
+
+        if response.status_code == 200 and "errors" not in json_response:
+            data = json_response["data"]
+            if getattr(response, "from_cache", False):
+                # the cached body carries the budget snapshot from when it was stored;
+                # replaying it would clobber the live rate-limit accounting
+                data.pop(RATE_LIMIT_ALIAS, None)
+            else:
+                self._update_rate_limit(data, getattr(response, "auth_header", None))
+            return data
+        raise QueryFailedException(query=query, response=response)
+
+    async def _execution_generator(
+        self,
+        query: PaginatedQuery,
+        stop_predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Handles the iteration over paginated query results, yielding each page's data as it's fetched.
+
+        Args:
+            query (PaginatedQuery): The paginated GraphQL query to execute.
+            stop_predicate (Optional[Callable]): An optional callable invoked with each page's
+            data after it is yielded; returning True stops pagination early, saving the
+            round-trips for pages the caller no longer needs.
+
+        Returns:
+            AsyncGenerator[Dict[str, Any], None]: An async generator yielding each page's data as a dictionary.
+        """
+        while query.paginator.has_next():
+            response = await self._execute(query)
+            curr_node = response
+
+            for field_name in query.path:
+                curr_node = curr_node[field_name]
+
+            end_cursor = curr_node["pageInfo"]["endCursor"]
+            has_next_page = curr_node["pageInfo"]["hasNextPage"]
+            query.paginator.update_paginator(has_next_page, end_cursor)
+            yield response
+            if stop_predicate is not None and stop_predicate(response):
+                break
+
+    def execute(
+        self,
+        query: Union[str, Query, PaginatedQuery],
+        stop_predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ):
+        """
+        Public method to execute a non-paginated or paginated query.
+
+        Args:
+            query (Union[str, Query, PaginatedQuery]): The GraphQL query to execute.
+            stop_predicate (Optional[Callable]): For paginated queries, an optional callable
+            that stops pagination early once a yielded page satisfies it.
+        Returns:
+            An awaitable resolving to the parsed JSON response for plain queries, or an async
+            generator of pages for paginated queries.
+        """
+        if isinstance(query, PaginatedQuery):
+            return self._execution_generator(query, stop_predicate)
+        return self._execute(query)
+
+    def clear_cache(self) -> None:
+        """
+        Drops every cached response, forcing subsequent queries back to the network.
+        """
+        self._response_cache.clear()
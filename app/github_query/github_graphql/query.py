@@ -1,9 +1,10 @@
 """The module defines four query-related classes that are used to generate GraphQL query strings
 in an object-oriented way."""
 
-from typing import Union, List, Dict, Tuple, Optional
+from typing import Union, List, Dict, Tuple, Optional, Callable
 from datetime import datetime
 from collections import deque
+from string import Template
 
 
 class InvalidQueryException(Exception):
@@ -46,6 +47,9 @@ class QueryNode:
     QueryNodes can be nested, allowing for the representation of complex queries.
     """
 
+    # Inner nodes are allocated by the dozen per query; slots avoid a per-instance __dict__.
+    __slots__ = ("name", "fields", "args")
+
     def __init__(
         self,
         name: str = "query",
@@ -159,6 +163,32 @@ class Query(QueryNode):
     It provides additional functionality for formatting and substituting values in preparation for execution.
     """
 
+    __slots__ = ()
+
+    # Per-subclass cache of rendered query-string templates, see cached_template().
+    _templates: Dict[type, Template] = {}
+
+    @classmethod
+    def cached_template(cls, factory: Callable[[], "Query"]) -> Template:
+        """
+        Returns the rendered query-string template for this subclass, building the QueryNode
+        tree through the given factory only on the first call. The factory should construct an
+        instance whose variable arguments are "$name" placeholders; subsequent callers
+        substitute their values into the cached template instead of re-walking the node tree.
+
+        Args:
+            factory (Callable[[], Query]): A zero-argument callable building a placeholder
+            instance of the subclass.
+
+        Returns:
+            Template: The cached string template of the rendered query.
+        """
+        template = Query._templates.get(cls)
+        if template is None:
+            template = Template(factory().get_query())
+            Query._templates[cls] = template
+        return template
+
     @staticmethod
     def test_time_format(time_string: str) -> bool:
         """
@@ -183,6 +213,8 @@ class QueryNodePaginator(QueryNode):
     It includes functionality to manage and track the state of pagination through GraphQL queries.
     """
 
+    __slots__ = ("has_next_page",)
+
     def __init__(
         self,
         name: str = "query",
@@ -257,6 +289,8 @@ class PaginatedQuery(Query):
     and navigation through pages.
     """
 
+    __slots__ = ("path", "paginator")
+
     def __init__(
         self,
         name: str = "query",
@@ -0,0 +1,9 @@
+from .batched_user_contributions import BatchedUserContributionsCollection
+from .batched_user_metrics import BatchedUserMetrics
+from .batched_user_profile_stats import BatchedUserProfileStats
+
+__all__ = [
+    "BatchedUserContributionsCollection",
+    "BatchedUserMetrics",
+    "BatchedUserProfileStats",
+]
@@ -0,0 +1,151 @@
+"""The module defines the BatchedUserMetrics class, which formulates a single GraphQL query string
+that fetches a user's profile statistics and the first page of their repositories as aliased
+selections, cutting the per-user round-trips of the separate queries down to one."""
+
+from typing import Dict, Any, List, Tuple
+from app.github_query.github_graphql.query import QueryNode, Query
+from app.github_query.queries.constants import (
+    FIELD_NAME,
+    FIELD_TOTAL_COUNT,
+    FIELD_SIZE,
+    FIELD_END_CURSOR,
+    FIELD_HAS_NEXT_PAGE,
+    NODE_USER,
+    NODE_REPOSITORIES,
+    NODE_LANGUAGES,
+    NODE_EDGES,
+    NODE_NODE,
+    NODE_NODES,
+    NODE_PAGE_INFO,
+    ARG_LOGIN,
+    ARG_FIRST,
+    ARG_IS_FORK,
+    ARG_OWNER_AFFILIATIONS,
+    ARG_ORDER_BY,
+    ARG_FIELD,
+    ARG_DIRECTION,
+)
+from app.github_query.queries.profiles import UserProfileStats
+
+# Aliases used for the two user selections batched into one document.
+ALIAS_PROFILE = "profile"
+ALIAS_REPOSITORIES = "repositories"
+
+
+class BatchedUserMetrics(Query):
+    """
+    BatchedUserMetrics is a subclass of Query that fuses the selections of UserProfileStats and
+    the first page of UserRepositories into one document using GraphQL aliases, so that mining a
+    user costs a single HTTP request instead of one per sub-query. Remaining repository pages,
+    if any, are fetched through the regular UserRepositories paginated query.
+    """
+
+    def __init__(
+        self,
+        login: str,
+        is_fork: bool = False,
+        ownership: str = "[OWNER]",
+        pg_size: int = 100,
+        repo_order_field: str = "CREATED_AT",
+        repo_order_dir: str = "DESC",
+        lang_limit: int = 20,
+    ) -> None:
+        """
+        Initializes a batched query for a user's profile statistics and first repository page.
+        """
+        super().__init__(
+            fields=[
+                QueryNode(
+                    f"{ALIAS_PROFILE}: {NODE_USER}",
+                    args={ARG_LOGIN: login},
+                    fields=UserProfileStats.profile_fields(),
+                ),
+                QueryNode(
+                    f"{ALIAS_REPOSITORIES}: {NODE_USER}",
+                    args={ARG_LOGIN: login},
+                    fields=[
+                        QueryNode(
+                            NODE_REPOSITORIES,
+                            args={
+                                ARG_FIRST: pg_size,
+                                ARG_IS_FORK: is_fork,
+                                ARG_OWNER_AFFILIATIONS: ownership,
+                                ARG_ORDER_BY: {
+                                    ARG_FIELD: repo_order_field,
+                                    ARG_DIRECTION: repo_order_dir,
+                                },
+                            },
+                            fields=[
+                                FIELD_TOTAL_COUNT,
+                                QueryNode(
+                                    NODE_NODES,
+                                    fields=[
+                                        QueryNode(
+                                            NODE_LANGUAGES,
+                                            # the selection is truncated, so order by size:
+                                            # the largest languages must be the edges that
+                                            # cross the wire
+                                            args={
+                                                ARG_FIRST: lang_limit,
+                                                ARG_ORDER_BY: {
+                                                    ARG_FIELD: "SIZE",
+                                                    ARG_DIRECTION: "DESC",
+                                                },
+                                            },
+                                            fields=[
+                                                FIELD_TOTAL_COUNT,
+                                                QueryNode(
+                                                    NODE_EDGES,
+                                                    fields=[
+                                                        FIELD_SIZE,
+                                                        QueryNode(
+                                                            NODE_NODE,
+                                                            fields=[FIELD_NAME],
+                                                        ),
+                                                    ],
+                                                ),
+                                            ],
+                                        ),
+                                    ],
+                                ),
+                                QueryNode(
+                                    NODE_PAGE_INFO,
+                                    fields=[FIELD_END_CURSOR, FIELD_HAS_NEXT_PAGE],
+                                ),
+                            ],
+                        ),
+                    ],
+                ),
+            ]
+        )
+
+    @staticmethod
+    def profile_stats(raw_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extracts the profile statistics from the aliased response, reusing the
+        UserProfileStats extractor.
+
+        Args:
+            raw_data (dict): The raw data returned by the batched query.
+
+        Returns:
+            dict: A flat dictionary of user profile statistics.
+        """
+        return UserProfileStats.profile_stats({NODE_USER: raw_data[ALIAS_PROFILE]})
+
+    @staticmethod
+    def user_repositories(
+        raw_data: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Extracts the first page of repositories and its pageInfo from the aliased response.
+
+        Args:
+            raw_data (dict): The raw data returned by the batched query.
+
+        Returns:
+            A tuple of the repository list and the pageInfo dictionary, whose endCursor can seed
+            a UserRepositories paginator for any remaining pages.
+        """
+        repositories = raw_data[ALIAS_REPOSITORIES][NODE_REPOSITORIES]
+        return repositories[NODE_NODES], repositories[NODE_PAGE_INFO]
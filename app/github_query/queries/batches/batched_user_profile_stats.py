@@ -0,0 +1,64 @@
+"""The module defines the BatchedUserProfileStats class, which formulates a single GraphQL query
+string that fetches the profile statistics of several users at once as aliased selections,
+cutting N per-user round-trips down to one."""
+
+from typing import Dict, Any, List
+from app.github_query.github_graphql.query import QueryNode, Query
+from app.github_query.queries.constants import (
+    NODE_USER,
+    ARG_LOGIN,
+)
+from app.github_query.queries.profiles import UserProfileStats
+
+
+class BatchedUserProfileStats(Query):
+    """
+    BatchedUserProfileStats is a subclass of Query that fans the UserProfileStats selection out
+    over several logins in one document, aliasing each user selection as u0, u1, ... so that a
+    group of users costs a single HTTP request. The batch size is capped because every aliased
+    selection adds to the query's rate-limit cost and response size.
+    """
+
+    MAX_BATCH_SIZE = 50
+
+    def __init__(self, logins: List[str]) -> None:
+        """
+        Initializes a batched query for the profile statistics of the given users.
+
+        Args:
+            logins (List[str]): The user logins to fetch, at most MAX_BATCH_SIZE of them.
+        """
+        if not logins:
+            raise ValueError("Logins must not be empty")
+        if len(logins) > self.MAX_BATCH_SIZE:
+            raise ValueError(
+                f"At most {self.MAX_BATCH_SIZE} logins can be batched into one query"
+            )
+        super().__init__(
+            fields=[
+                QueryNode(
+                    f"u{i}: {NODE_USER}",
+                    args={ARG_LOGIN: login},
+                    fields=UserProfileStats.profile_fields(),
+                )
+                for i, login in enumerate(logins)
+            ]
+        )
+
+    @staticmethod
+    def profile_stats(raw_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Extracts the profile statistics of every batched user from the aliased response,
+        reusing the UserProfileStats extractor on each aliased block. The aliases come back
+        in query order, so the result lines up with the logins passed to the constructor.
+
+        Args:
+            raw_data (dict): The raw data returned by the batched query.
+
+        Returns:
+            list: A list of flat user profile statistics dictionaries, one per login.
+        """
+        return [
+            UserProfileStats.profile_stats({NODE_USER: block})
+            for block in raw_data.values()
+        ]
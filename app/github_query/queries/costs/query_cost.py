@@ -17,6 +17,9 @@ class QueryCost(Query):
     It includes the 'rateLimit' field to determine the cost, remaining quota, and reset time for rate limiting purposes.
     """
 
+    # Rendered rateLimit fragments keyed by the dryRun flag, built once on first use.
+    _rendered_fragments: dict = {}
+
     def __init__(self, query: str, dryrun: bool) -> None:
         """
         Initializes a QueryCost object with a test query that represents the actual query for which the cost is to be
@@ -42,3 +45,35 @@ class QueryCost(Query):
                 ),
             ]
         )
+
+    @classmethod
+    def rendered(cls, query: str, dryrun: bool) -> str:
+        """
+        Returns the rendered query string wrapping the given query content. Only the inner
+        query varies per call, so the rateLimit fragment is rendered once per dryRun flag and
+        concatenated around the content instead of rebuilding the QueryNode tree.
+
+        Args:
+            query (str): The query content whose cost is to be calculated.
+            dryrun (bool): Whether the rate limit should be checked without counting usage.
+
+        Returns:
+            str: The rendered GraphQL query string.
+        """
+        if not query:
+            raise ValueError("Test query must not be empty")
+        fragment = cls._rendered_fragments.get(dryrun)
+        if fragment is None:
+            fragment = str(
+                QueryNode(
+                    NODE_RATE_LIMIT,
+                    args={ARG_DRYRUN: dryrun},
+                    fields=[
+                        FIELD_COST,
+                        FIELD_REMAINING,
+                        FIELD_RESET_AT,
+                    ],
+                )
+            )
+            cls._rendered_fragments[dryrun] = fragment
+        return f"query {{ {query} {fragment} }}"
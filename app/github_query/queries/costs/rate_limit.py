@@ -39,3 +39,20 @@ class RateLimit(Query):
                 )
             ]
         )
+
+    @classmethod
+    def rendered(cls, dryrun: bool) -> str:
+        """
+        Returns the rendered query string for the given dryRun flag. The QueryNode tree is
+        built and serialized once per class; subsequent calls substitute into the cached
+        template instead of re-walking the tree.
+
+        Args:
+            dryrun (bool): Whether the rate limit should be checked without counting usage.
+
+        Returns:
+            str: The rendered GraphQL query string.
+        """
+        return cls.cached_template(lambda: cls(dryrun="$dryrun")).safe_substitute(
+            dryrun=str(dryrun).lower()
+        )
@@ -13,6 +13,10 @@ from app.github_query.queries.constants import (
 )
 
 
+# Rendered at import time: the viewer query has no variable arguments at all.
+USER_LOGIN_VIEWER_QUERY = "query { viewer { login } }"
+
+
 class UserLoginViewer(Query):
     """
     UserLoginViewer is a subclass of Query designed to fetch the viewer's login information using the 'viewer' field
@@ -32,6 +36,17 @@ class UserLoginViewer(Query):
             ]
         )
 
+    @classmethod
+    def rendered(cls) -> str:
+        """
+        Returns the query string, emitted as a module-level literal at import time since the
+        query has no variable arguments.
+
+        Returns:
+            str: The rendered GraphQL query string.
+        """
+        return USER_LOGIN_VIEWER_QUERY
+
 
 class UserLogin(Query):
     """
@@ -61,3 +76,20 @@ class UserLogin(Query):
                 )
             ]
         )
+
+    @classmethod
+    def rendered(cls, login: str) -> str:
+        """
+        Returns the rendered query string for the given user. The QueryNode tree is built and
+        serialized once per class; subsequent calls substitute the login into the cached
+        template instead of re-walking the tree.
+
+        Args:
+            login (str): The user login.
+
+        Returns:
+            str: The rendered GraphQL query string.
+        """
+        return cls.cached_template(lambda: cls(login="$login")).safe_substitute(
+            login=login
+        )
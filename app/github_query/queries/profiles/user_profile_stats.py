@@ -1,12 +1,10 @@
 """The module defines UserProfileStats that formulate GraphQL query string to extract user profile information 
 for a given GitHub ID. Only the used fields are queried, open to customization."""
 
-from typing import Dict, Any
+from typing import Dict, List, Any
 from app.github_query.github_graphql.query import QueryNode, Query
 from app.github_query.queries.constants import (
     FIELD_LOGIN,
-    FIELD_NAME,
-    FIELD_EMAIL,
     FIELD_CREATED_AT,
     FIELD_TOTAL_COUNT,
     NODE_USER,
@@ -37,27 +35,53 @@ class UserProfileStats(Query):
                 QueryNode(
                     NODE_USER,
                     args={ARG_LOGIN: login},
-                    fields=[
-                        FIELD_LOGIN,
-                        FIELD_NAME,
-                        FIELD_EMAIL,
-                        FIELD_CREATED_AT,
-                        # Nodes representing counts of various items related to the user:
-                        QueryNode(NODE_ISSUES, fields=[FIELD_TOTAL_COUNT]),
-                        QueryNode(NODE_PULL_REQUESTS, fields=[FIELD_TOTAL_COUNT]),
-                        QueryNode(NODE_REPOSITORIES, fields=[FIELD_TOTAL_COUNT]),
-                        QueryNode(NODE_GIST_COMMENTS, fields=[FIELD_TOTAL_COUNT]),
-                        QueryNode(NODE_ISSUE_COMMENTS, fields=[FIELD_TOTAL_COUNT]),
-                        QueryNode(NODE_COMMIT_COMMENTS, fields=[FIELD_TOTAL_COUNT]),
-                        QueryNode(
-                            NODE_REPOSITORY_DISCUSSION_COMMENTS,
-                            fields=[FIELD_TOTAL_COUNT],
-                        ),
-                    ],
+                    fields=UserProfileStats.profile_fields(),
                 )
             ]
         )
 
+    @staticmethod
+    def profile_fields() -> List[Any]:
+        """
+        Returns a fresh list of the profile selection fields, shared by every query that embeds
+        a user's profile statistics (including the batched variants).
+
+        Returns:
+            List[Any]: The field names and QueryNodes of the profile selection.
+        """
+        return [
+            FIELD_LOGIN,
+            FIELD_CREATED_AT,
+            # Nodes representing counts of various items related to the user:
+            QueryNode(NODE_ISSUES, fields=[FIELD_TOTAL_COUNT]),
+            QueryNode(NODE_PULL_REQUESTS, fields=[FIELD_TOTAL_COUNT]),
+            QueryNode(NODE_REPOSITORIES, fields=[FIELD_TOTAL_COUNT]),
+            QueryNode(NODE_GIST_COMMENTS, fields=[FIELD_TOTAL_COUNT]),
+            QueryNode(NODE_ISSUE_COMMENTS, fields=[FIELD_TOTAL_COUNT]),
+            QueryNode(NODE_COMMIT_COMMENTS, fields=[FIELD_TOTAL_COUNT]),
+            QueryNode(
+                NODE_REPOSITORY_DISCUSSION_COMMENTS,
+                fields=[FIELD_TOTAL_COUNT],
+            ),
+        ]
+
+    @classmethod
+    def rendered(cls, login: str) -> str:
+        """
+        Returns the rendered query string for the given user. The QueryNode tree is built and
+        serialized once per class; subsequent calls substitute the login into the cached
+        template instead of re-walking the tree.
+
+        Args:
+            login (str): The user login.
+
+        Returns:
+            str: The rendered GraphQL query string.
+        """
+        return cls.cached_template(lambda: cls(login="$login")).safe_substitute(
+            login=login
+        )
+
     @staticmethod
     def profile_stats(raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -75,7 +99,7 @@ class UserProfileStats(Query):
             Each piece of information is extracted from the nested structure of the
             input and presented as a flat dictionary for easier access.
         """
-        profile_stats = raw_data.get("user", {})
+        profile_stats = raw_data["user"]
         processed_stats = {
             "login": profile_stats[FIELD_LOGIN],
             "created_at": profile_stats[FIELD_CREATED_AT],
@@ -1,7 +1,7 @@
 """The module defines the UserRepositories class, which formulates the GraphQL query string
 to extract repositories created by the user based on a given user ID."""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from app.github_query.github_graphql.query import (
     QueryNode,
     PaginatedQuery,
@@ -41,15 +41,46 @@ class UserRepositories(PaginatedQuery):
         login: str,
         is_fork: bool = False,
         ownership: str = "[OWNER]",
-        pg_size: int = 10,
+        pg_size: int = 100,
         repo_order_field: str = "CREATED_AT",
         repo_order_dir: str = "DESC",
-        lag_order_field: str = "SIZE",
-        lag_order_dir: str = "DESC",
+        lang_limit: int = 20,
+        fields_mode: str = "full",
+        top_k: Optional[int] = None,
     ) -> None:
         """
         Initializes a query for a user's repositories with various filtering and ordering options.
+        fields_mode selects the languages selection: "full" fetches the per-language edges with
+        sizes, while "counts" fetches only languages.totalCount per repository — a much smaller
+        payload for callers that never walk the edges. Note that totalCount counts languages per
+        repository, so it cannot replace the cross-repository unique-language set.
+        top_k truncates the languages selection to the K largest languages per repository,
+        ordered server-side by size, for callers interested only in the dominant languages;
+        smaller languages then never cross the wire, but the truncated edges undercount the
+        unique-language set.
         """
+        # the selection is truncated either way, so order by size: the largest languages —
+        # the ones the aggregates measure — must be the edges that cross the wire
+        languages_args = {
+            ARG_FIRST: top_k if top_k is not None else lang_limit,
+            ARG_ORDER_BY: {ARG_FIELD: "SIZE", ARG_DIRECTION: "DESC"},
+        }
+        if fields_mode == "counts":
+            languages_fields = [FIELD_TOTAL_COUNT]
+        else:
+            languages_fields = [
+                FIELD_TOTAL_COUNT,
+                QueryNode(
+                    NODE_EDGES,
+                    fields=[
+                        FIELD_SIZE,
+                        QueryNode(
+                            NODE_NODE,
+                            fields=[FIELD_NAME],
+                        ),
+                    ],
+                ),
+            ]
         super().__init__(
             fields=[
                 QueryNode(
@@ -74,26 +105,8 @@ class UserRepositories(PaginatedQuery):
                                     fields=[
                                         QueryNode(
                                             NODE_LANGUAGES,
-                                            args={
-                                                ARG_FIRST: 100,
-                                                ARG_ORDER_BY: {
-                                                    ARG_FIELD: lag_order_field,
-                                                    ARG_DIRECTION: lag_order_dir,
-                                                },
-                                            },
-                                            fields=[
-                                                FIELD_TOTAL_COUNT,
-                                                QueryNode(
-                                                    NODE_EDGES,
-                                                    fields=[
-                                                        FIELD_SIZE,
-                                                        QueryNode(
-                                                            NODE_NODE,
-                                                            fields=[FIELD_NAME],
-                                                        ),
-                                                    ],
-                                                ),
-                                            ],
+                                            args=languages_args,
+                                            fields=languages_fields,
                                         ),
                                     ],
                                 ),
@@ -119,5 +132,7 @@ class UserRepositories(PaginatedQuery):
         Returns:
             A list of dictionaries, each containing data about a single repository.
         """
-        repositories = raw_data.get("user", {}).get("repositories", {}).get("nodes", [])
-        return repositories
+        try:
+            return raw_data["user"]["repositories"]["nodes"]
+        except (KeyError, TypeError):
+            return []
@@ -1,8 +1,7 @@
 """The module defines the UserContributionsCollection class, which formulates the GraphQL query string
 to extract the number of various contribution made by the user based on a given user ID."""
 
-from typing import Dict, Any
-from collections import Counter
+from typing import Dict, List, Any
 from app.github_query.github_graphql.query import QueryNode, Query
 from app.github_query.queries.constants import (
     ARG_LOGIN,
@@ -10,8 +9,6 @@ from app.github_query.queries.constants import (
     ARG_TO,
     NODE_USER,
     NODE_CONTRIBUTIONS_COLLECTION,
-    FIELD_STARTED_AT,
-    FIELD_ENDED_AT,
     FIELD_RESTRICTED_CONTRIBUTIONS_COUNT,
     FIELD_TOTAL_COMMIT_CONTRIBUTIONS,
     FIELD_TOTAL_ISSUE_CONTRIBUTIONS,
@@ -48,16 +45,7 @@ class UserContributionsCollection(Query):
                                 ARG_FROM: start,
                                 ARG_TO: end,
                             },
-                            fields=[
-                                FIELD_STARTED_AT,
-                                FIELD_ENDED_AT,
-                                FIELD_RESTRICTED_CONTRIBUTIONS_COUNT,
-                                FIELD_TOTAL_COMMIT_CONTRIBUTIONS,
-                                FIELD_TOTAL_ISSUE_CONTRIBUTIONS,
-                                FIELD_TOTAL_PULL_REQUEST_CONTRIBUTIONS,
-                                FIELD_TOTAL_PULL_REQUEST_REVIEW_CONTRIBUTIONS,
-                                FIELD_TOTAL_REPOSITORY_CONTRIBUTIONS,
-                            ],
+                            fields=UserContributionsCollection.contribution_fields(),
                         ),
                     ],
                 )
@@ -65,27 +53,63 @@ class UserContributionsCollection(Query):
         )
 
     @staticmethod
-    def user_contributions_collection(raw_data: Dict[str, Any]) -> Counter:
+    def contribution_fields() -> List[Any]:
+        """
+        Returns a fresh list of the contribution count fields, shared by every query that embeds
+        a contributionsCollection selection (including the batched variants). startedAt/endedAt
+        are the request's own window echoed back, so they are not selected.
+
+        Returns:
+            List[Any]: The field names of the contributionsCollection selection.
+        """
+        return [
+            FIELD_RESTRICTED_CONTRIBUTIONS_COUNT,
+            FIELD_TOTAL_COMMIT_CONTRIBUTIONS,
+            FIELD_TOTAL_ISSUE_CONTRIBUTIONS,
+            FIELD_TOTAL_PULL_REQUEST_CONTRIBUTIONS,
+            FIELD_TOTAL_PULL_REQUEST_REVIEW_CONTRIBUTIONS,
+            FIELD_TOTAL_REPOSITORY_CONTRIBUTIONS,
+        ]
+
+    @classmethod
+    def rendered(cls, login: str, start: str, end: str) -> str:
+        """
+        Returns the rendered query string for the given user and time window. The QueryNode
+        tree is built and serialized once per class; subsequent calls substitute into the
+        cached template, which matters because one query is issued per 365-day window.
+
+        Args:
+            login (str): The user login.
+            start (str): The start of the time window.
+            end (str): The end of the time window.
+
+        Returns:
+            str: The rendered GraphQL query string.
+        """
+        template = cls.cached_template(
+            lambda: cls(login="$login", start="$start", end="$end")
+        )
+        return template.safe_substitute(login=login, start=f'"{start}"', end=f'"{end}"')
+
+    @staticmethod
+    def user_contributions_collection(raw_data: Dict[str, Any]) -> Dict[str, int]:
         """
         Processes the raw data returned from a GraphQL query about a user's contributions collection
-        and aggregates the various types of contributions into a countable collection.
+        and aggregates the various types of contributions into a plain dictionary of counts.
 
         Args:
             raw_data (dict): The raw data returned by the query,
                             expected to contain nested contribution counts.
 
         Returns:
-            Counter: A collection counter aggregating the various types of contributions made by the user.
+            Dict[str, int]: The various types of contributions made by the user, keyed by kind.
         """
         raw_data = raw_data[NODE_USER][NODE_CONTRIBUTIONS_COLLECTION]
-        contribution_collection = Counter(
-            {
-                "res_con": raw_data[FIELD_RESTRICTED_CONTRIBUTIONS_COUNT],
-                "commit": raw_data[FIELD_TOTAL_COMMIT_CONTRIBUTIONS],
-                "issue": raw_data[FIELD_TOTAL_ISSUE_CONTRIBUTIONS],
-                "pr": raw_data[FIELD_TOTAL_PULL_REQUEST_CONTRIBUTIONS],
-                "pr_review": raw_data[FIELD_TOTAL_PULL_REQUEST_REVIEW_CONTRIBUTIONS],
-                "repository": raw_data[FIELD_TOTAL_REPOSITORY_CONTRIBUTIONS],
-            }
-        )
-        return contribution_collection
+        return {
+            "res_con": raw_data[FIELD_RESTRICTED_CONTRIBUTIONS_COUNT],
+            "commit": raw_data[FIELD_TOTAL_COMMIT_CONTRIBUTIONS],
+            "issue": raw_data[FIELD_TOTAL_ISSUE_CONTRIBUTIONS],
+            "pr": raw_data[FIELD_TOTAL_PULL_REQUEST_CONTRIBUTIONS],
+            "pr_review": raw_data[FIELD_TOTAL_PULL_REQUEST_REVIEW_CONTRIBUTIONS],
+            "repository": raw_data[FIELD_TOTAL_REPOSITORY_CONTRIBUTIONS],
+        }
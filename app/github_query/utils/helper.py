@@ -5,10 +5,31 @@ import re
 import string
 import random
 from datetime import datetime, timedelta
+from functools import lru_cache
 from app.github_query.github_graphql.query import Query
 from app.github_query.github_graphql.client import Client
 from app.github_query.queries.costs.query_cost import QueryCost
 
+# Matches the content of the outermost query block. Compiled once at import time; DOTALL lets
+# the pattern span queries rendered across multiple lines.
+_QUERY_CONTENT_RE = re.compile(r"query\s*\{(?P<content>.+)\}", re.DOTALL)
+
+
+@lru_cache(maxsize=1024)
+def _parse_time(time_string: str) -> datetime:
+    """
+    Parses a GitHub time string formatted as "%Y-%m-%dT%H:%M:%SZ" into a datetime, memoizing the
+    result so the same boundary strings are not re-parsed across repeated calls.
+
+    Args:
+        time_string (str): The time string to parse.
+
+    Returns:
+        datetime: The parsed datetime.
+    """
+    # fromisoformat is a C fast-path; the trailing Z needs rewriting before 3.11
+    return datetime.fromisoformat(time_string.replace("Z", "+00:00"))
+
 
 def print_methods(obj: object) -> None:
     """
@@ -74,16 +95,14 @@ def add_by_days(time_string: str, days: int) -> str:
     Returns:
         str: A new time string one year later than the input.
     """
-    time_format = "%Y-%m-%dT%H:%M:%SZ"
-
     # Convert the string to a datetime object
-    time = datetime.strptime(time_string, time_format)
+    time = _parse_time(time_string)
 
     # Add a duration of given number of days
     new_time = time + timedelta(days=days)
 
     # Convert the new datetime object back to a string
-    new_time_string = new_time.strftime(time_format)
+    new_time_string = new_time.strftime("%Y-%m-%dT%H:%M:%SZ")
     return new_time_string
 
 
@@ -98,16 +117,14 @@ def minus_by_days(time_string: str, days: int) -> str:
     Returns:
         str: A new time string one year later than the input.
     """
-    time_format = "%Y-%m-%dT%H:%M:%SZ"
-
     # Convert the string to a datetime object
-    time = datetime.strptime(time_string, time_format)
+    time = _parse_time(time_string)
 
     # Minus a duration of given number of days
     new_time = time - timedelta(days=days)
 
     # Convert the new datetime object back to a string
-    new_time_string = new_time.strftime(time_format)
+    new_time_string = new_time.strftime("%Y-%m-%dT%H:%M:%SZ")
     return new_time_string
 
 
@@ -123,9 +140,8 @@ def in_time_period(time: str, start: str, end: str) -> bool:
     Returns:
         bool: True if the time is within the period; False otherwise.
     """
-    time = datetime.strptime(time, "%Y-%m-%dT%H:%M:%SZ")
-    start = datetime.strptime(start, "%Y-%m-%dT%H:%M:%SZ")
-    end = datetime.strptime(end, "%Y-%m-%dT%H:%M:%SZ")
+    # GitHub timestamps share the fixed "%Y-%m-%dT%H:%M:%SZ" layout, so the ISO-8601 strings
+    # compare lexicographically in chronological order and need no parsing
     return end >= time >= start
 
 
@@ -140,8 +156,7 @@ def created_before(created: str, time: str) -> bool:
     Returns:
         bool: True if created before the specified time; False otherwise.
     """
-    time = datetime.strptime(time, "%Y-%m-%dT%H:%M:%SZ")
-    created = datetime.strptime(created, "%Y-%m-%dT%H:%M:%SZ")
+    # fixed-width ISO-8601 strings compare lexicographically in chronological order
     return created < time
 
 
@@ -156,8 +171,7 @@ def created_after(created: str, time: str) -> bool:
     Returns:
         bool: True if created after the specified time; False otherwise.
     """
-    time = datetime.strptime(time, "%Y-%m-%dT%H:%M:%SZ")
-    created = datetime.strptime(created, "%Y-%m-%dT%H:%M:%SZ")
+    # fixed-width ISO-8601 strings compare lexicographically in chronological order
     return created > time
 
 
@@ -203,9 +217,9 @@ def have_rate_limit(client: Client, query: Query, args: dict) -> list:
         list: A list containing a boolean indicating whether the rate limit is sufficient and the reset time.
     """
     query_string = str(query.substitute(**args))
-    match = re.search(r"query\s*{(?P<content>.+)}", query_string)
+    match = _QUERY_CONTENT_RE.search(query_string)
     rate_limit = client.execute(
-        query=QueryCost(match.group("content")), substitutions={"dryrun": True}
+        query=QueryCost.rendered(match.group("content"), dryrun=True)
     )["rateLimit"]
     cost = rate_limit["cost"]
     remaining = rate_limit["remaining"]
